@@ -1,4 +1,17 @@
+import os
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared HTTP session, reusing connections and retrying transient failures
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                      max_retries=Retry(total=3, backoff_factor=0.5)))
+
+# Local copy of robots.txt, reused while it is less than a week old
+robots_cache_path = "data/robots.txt"
+robots_cache_max_age = 7 * 24 * 60 * 60  # seconds
 
 # Check rules for web scraping
 def check_robots() -> str:
@@ -7,10 +20,12 @@ def check_robots() -> str:
 
   Steps
   -------
-  - Define a URL
-  - Sends an HTTP GET request to the defined URL
-  - Prints the HTTP status code and reason
-  - Stores the response text
+  - If a local copy of robots.txt younger than 'robots_cache_max_age' exists, reads it from disk
+  - Otherwise:
+    - Define a URL
+    - Sends an HTTP GET request to the defined URL through the shared session
+    - Prints the HTTP status code and reason
+    - Stores the response text, saving it locally if the request succeeded
   - Prints the response
 
   Returns
@@ -22,10 +37,21 @@ def check_robots() -> str:
   check_robots()
 
   """
-  url = "https://www.airlinequality.com/robots.txt"
-  response = requests.get(url)
-  print(f"{response.status_code} {response.reason}")
-  text = response.text
+  if os.path.exists(robots_cache_path) and time.time() - os.path.getmtime(robots_cache_path) < robots_cache_max_age:
+    print(f"Using cached {robots_cache_path}")
+    with open(robots_cache_path, "r", encoding="utf-8") as file:
+      text = file.read()
+  else:
+    url = "https://www.airlinequality.com/robots.txt"
+    response = session.get(url, timeout=10)
+    print(f"{response.status_code} {response.reason}")
+    text = response.text
+    if response.status_code == 200:
+      os.makedirs(os.path.dirname(robots_cache_path), exist_ok=True)
+      with open(robots_cache_path, "w", encoding="utf-8") as file:
+        file.write(text)
   print(text)
+  return text
 
-check_robots()
+if __name__ == "__main__":
+  check_robots()
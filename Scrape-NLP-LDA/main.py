@@ -6,11 +6,9 @@ import os
 from check_robots import check_robots
 from scraping import download_airline_reviews
 from processing import consolidate_reviews
-from storage import save_reviews_to_file, read_and_print_reviews, load_reviews_df
-from nlp import nlp_pipeline, create_sentiment_dataframes, analyse_verification_status,\
-                calculate_sentiment_percentage,analyse_delays
-from visualisations import generate_word_clouds, plot_sentiment_counts, plot_polarity_subjectivity, \
-                         plot_sentiment_by_airline, plot_average_rating_by_airline, plot_delay_keywords
+from storage import save_reviews_df, read_and_print_reviews, load_reviews_df
+from nlp import nlp_pipeline, analyse_verification_status, calculate_sentiment_percentage, analyse_delays
+from visualisations import render_dashboard
 from topic_modelling import preprocess_for_topic_modelling, apply_lda_model, visualise_lda_topics
 
 
@@ -30,19 +28,19 @@ def task_download_reviews() -> None:
     download_airline_reviews()
 
 @task
-def task_consolidate_reviews() -> list:
-    """Task: Consolidate reviews from the downloaded HTML files."""
+def task_consolidate_reviews() -> pd.DataFrame:
+    """Task: Consolidate reviews from the downloaded HTML files into a DataFrame."""
     return consolidate_reviews()
 
 @task
-def task_save_reviews(reviews: list) -> None:
-    """Task: Save the consolidated reviews to a text file."""
-    save_reviews_to_file(reviews, filename="all_reviews.txt")  # 'data/' prefix is handled in storage.py
+def task_save_reviews(df: pd.DataFrame, path: str = "data/all_reviews.parquet") -> None:
+    """Task: Save the consolidated reviews to a Parquet file."""
+    save_reviews_df(df, path=path)
 
 @task
-def task_load_reviews_df() -> pd.DataFrame:
+def task_load_reviews_df(path: str = "data/all_reviews.parquet") -> pd.DataFrame:
     """Task: Load the saved reviews into a DataFrame."""
-    return load_reviews_df("data/all_reviews.txt")
+    return load_reviews_df(path)
 
 @task
 def task_apply_nlp(df: pd.DataFrame) -> pd.DataFrame:
@@ -50,15 +48,9 @@ def task_apply_nlp(df: pd.DataFrame) -> pd.DataFrame:
     return nlp_pipeline(df, review_column="Review_Text")
 
 @task
-def task_create_sentiment_dataframes(df: pd.DataFrame) -> tuple:
-    """Task: Create separate DataFrames for each sentiment category."""
-    return create_sentiment_dataframes(df)
-
-@task
-def task_calculate_sentiment_percentage(df_positive: pd.DataFrame, df_negative: pd.DataFrame,
-                                        df_neutral: pd.DataFrame, df: pd.DataFrame) -> None:
+def task_calculate_sentiment_percentage(df: pd.DataFrame) -> None:
     """Task: Calculate sentiment percentages."""
-    calculate_sentiment_percentage(df_positive, df_negative, df_neutral, df)
+    calculate_sentiment_percentage(df)
 
 @task
 def task_analyse_verification(df: pd.DataFrame) -> None:
@@ -71,16 +63,9 @@ def task_analyse_delays(df: pd.DataFrame) -> pd.DataFrame:
     return analyse_delays(df)    
 
 @task
-def task_visualisation(df_positive: pd.DataFrame, df_negative: pd.DataFrame,
-                             df_neutral: pd.DataFrame, df: pd.DataFrame) -> None:
-    """Task: Visualise sentiment analysis results."""
-    generate_word_clouds(df_positive, df_negative, df_neutral)
-    plot_polarity_subjectivity(df)
-    plot_sentiment_counts(df)
-    plot_sentiment_by_airline(df)
-    plot_average_rating_by_airline(df)
-    delay_keywords_df = task_analyse_delays(df_negative)
-    plot_delay_keywords(delay_keywords_df)
+def task_visualisation(df: pd.DataFrame, delay_keywords_df: pd.DataFrame) -> None:
+    """Task: Visualise sentiment analysis results in a single dashboard figure."""
+    render_dashboard(df, delay_keywords_df)
 
 @task
 def task_topic_modelling(df: pd.DataFrame) -> None:
@@ -93,9 +78,10 @@ def task_topic_modelling(df: pd.DataFrame) -> None:
 # Prefect Flow
 
 @flow
-def main_flow() -> None:
+def main_flow(verbose: bool = False) -> None:
     """
     Main Prefect flow for scraping, processing and analysing airline reviews.
+    Set 'verbose' to print the saved reviews to the terminal.
 
     Steps
     ------
@@ -116,23 +102,23 @@ def main_flow() -> None:
     task_download_reviews()
 
     # Step 3: Consolidate reviews
-    reviews = task_consolidate_reviews()
-    task_save_reviews(reviews)
+    reviews_df = task_consolidate_reviews()
 
-    # Step 4: Load reviews into a DataFrame
-    read_and_print_reviews("data/all_reviews.txt")
+    # Step 4: Save and reload reviews as a DataFrame
+    task_save_reviews(reviews_df)
+    if verbose:
+        read_and_print_reviews("data/all_reviews.parquet")
     df = task_load_reviews_df()
 
     # Step 5: Apply NLP and sentiment analysis
     df_processed = task_apply_nlp(df)
     task_analyse_verification(df_processed)
-    df_positive, df_negative, df_neutral = task_create_sentiment_dataframes(df_processed)
 
     # Step 6: Analyse delay keywords
-    delay_keywords_df = task_analyse_delays(df_negative)
+    delay_keywords_df = task_analyse_delays(df_processed)
 
     # Step 7: Visualise results
-    task_visualisation(df_positive, df_negative, df_neutral, df_processed)
+    task_visualisation(df_processed, delay_keywords_df)
 
     # Step 8: Perform topic modelling
     task_topic_modelling(df_processed)
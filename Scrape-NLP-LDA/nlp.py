@@ -1,45 +1,64 @@
 import re
 import string
-from typing import List, Tuple
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Dict, List, Tuple
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 from textblob import TextBlob
 import nltk
 from nltk.tokenize import TweetTokenizer
 from nltk.stem import PorterStemmer, WordNetLemmatizer
 from nltk.corpus import stopwords
-nltk.download('stopwords')
-nltk.download('wordnet')
-nltk.download('punkt')
+
+# NLTK data packages used here, with their location inside the NLTK data directory
+NLTK_RESOURCES = {'stopwords': 'corpora/stopwords', 'wordnet': 'corpora/wordnet', 'punkt': 'tokenizers/punkt'}
+
+# Download NLTK data packages only when they are missing
+def ensure_nltk_data(resources: Dict[str, str]) -> None:
+    """Look up each NLTK data package locally and download only the ones that are not installed."""
+    for package, path in resources.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(package)
+
+ensure_nltk_data(NLTK_RESOURCES)
 
 # Data Cleaning 
 
-# Global stopwords set
-STOPWORDS = set(stopwords.words('english'))
+# Global stopwords set, frozen since it is only used for lookups
+STOPWORDS = frozenset(stopwords.words('english'))
+
+# Single pattern for URLs, numbers, punctuation and repeating characters,
+# so each document is scanned once instead of once per cleaning step.
+# Repeats are matched across punctuation (e.g. "s's"), since the punctuation is removed before they collapse
+# URLs are removed whole; stripping punctuation first used to break them up before they could be matched
+PUNCTUATION = re.escape(string.punctuation)
+CLEANING_PATTERN = re.compile(
+    rf"(https?://\S+|www\.\S+)|(\d+)|([{PUNCTUATION}]+)|([^{PUNCTUATION}])(?:[{PUNCTUATION}]*\4)+"
+)
+
+# Shared tokenizer, stemmer and lemmatizer, built once instead of for every review
+TOKENIZER = TweetTokenizer()
+STEMMER = PorterStemmer()
+LEMMATIZER = WordNetLemmatizer()
 
 # Remove Stop Words
 def cleaning_stopwords(text: str) -> str:
     """Remove common stopwords from the text."""
     return " ".join([word for word in text.split() if word.lower() not in STOPWORDS])
 
-# Remove Punctuation
-def cleaning_punctuations(text: str) -> str:
-    """Remove punctuation characters from the text."""
-    return text.translate(str.maketrans('', '', string.punctuation))
-
-# Remove Repeating Characters
-def cleaning_repeating_chars(text: str) -> str:
-    """Reduce repeated characters (e.g., 'soooo' becomes 'so')."""
-    return re.sub(r'(.)\1+', r'\1', text)
+# Replace a match of CLEANING_PATTERN
+def replace_cleaning_match(match: re.Match) -> str:
+    """Keep a single copy of a repeated character and drop URLs, numbers and punctuation."""
+    return match.group(4) or ""
 
-# Remove URLs
-def cleaning_urls(text: str) -> str:
-    """Remove URLs from the text."""
-    return re.sub(r'https?://\S+|www\.\S+', '', text)
-
-# Remove Numbers
-def cleaning_numbers(text: str) -> str:
-    """Remove numbers from the text."""
-    return re.sub(r'\d+', '', text)
+# Remove URLs, numbers, punctuation and repeating characters in one pass
+def cleaning_combined(text: str) -> str:
+    """Apply the URL, number, punctuation and repeating character cleaning in a single regex pass."""
+    return CLEANING_PATTERN.sub(replace_cleaning_match, text)
 
 # Remove Short words
 def remove_short_words(text: str) -> str:
@@ -49,20 +68,29 @@ def remove_short_words(text: str) -> str:
 # Tokenize Text
 def tokenize_text(text: str) -> List[str]:
     """Tokenize the text using TweetTokenizer."""
-    tokenizer = TweetTokenizer()
-    return tokenizer.tokenize(text)
+    return TOKENIZER.tokenize(text)
+
+# Stem a single word
+@lru_cache(maxsize=200_000)
+def stem_word(word: str) -> str:
+    """Stem a single word, caching the result since review words repeat heavily."""
+    return STEMMER.stem(word)
+
+# Lemmatize a single word
+@lru_cache(maxsize=200_000)
+def lemmatize_word(word: str) -> str:
+    """Lemmatize a single word, caching the result since review words repeat heavily."""
+    return LEMMATIZER.lemmatize(word)
 
 # Apply Stemming
 def apply_stemming(tokens: List[str]) -> List[str]:
     """Apply stemming to a list of tokens."""
-    stemmer = PorterStemmer()
-    return [stemmer.stem(token) for token in tokens]
+    return [stem_word(token) for token in tokens]
 
 # Apply Lemmatization
 def apply_lemmatization(tokens: List[str]) -> List[str]:
     """Apply lemmatization to a list of tokens."""
-    lemmatizer = WordNetLemmatizer()
-    return [lemmatizer.lemmatize(token) for token in tokens]
+    return [lemmatize_word(token) for token in tokens]
 
 # Apply each step of text preprocessing
 def process_tokens(text: str) -> str:
@@ -90,41 +118,94 @@ def process_tokens(text: str) -> str:
     tokens = apply_lemmatization(tokens)
     return " ".join(tokens)
 
-# Apply each step of text cleaning, including preprocessing
-def full_cleaning(text: str) -> str:
+# Apply each step of text preprocessing to a batch of texts
+def process_tokens_batch(texts: List[str]) -> List[str]:
+    """
+    Batch version of 'process_tokens', giving the same result for every text
+
+    Steps
+    -----
+    - Tokenize every text with the shared tokenizer.
+    - Collect the distinct tokens across the whole batch.
+    - Stem and lemmatize each distinct token only once.
+    - Join the processed tokens of each text into a single string.
+
+    Parameters
+    ----------
+    The list of texts to be processed
+
+    Returns
+    -------
+    A list with one processed string per input text
+    """
+    token_lists = [tokenize_text(text) for text in texts]
+    vocabulary = set(chain.from_iterable(token_lists))
+    processed = {token: lemmatize_word(stem_word(token)) for token in vocabulary}
+    return [" ".join([processed[token] for token in tokens]) for tokens in token_lists]
+
+# Apply each step of text cleaning, including preprocessing, to a whole column of reviews
+def clean_reviews(reviews: pd.Series) -> pd.Series:
     """
-    Applies a sequence of cleaning steps to the text
+    Applies a sequence of cleaning steps to every review
 
     Steps
     -----
-      - Remove stopwords.
-      - Remove punctuation.
-      - Remove repeating characters.
-      - Remove URLs.
-      - Remove numbers.
-      - Remove very short words.
-      - Tokenize, then apply stemming and lemmatization.
-    Returns the fully cleaned text.
+    - Remove stopwords.
+    - Remove URLs, numbers and punctuation, and reduce repeating characters, in a single regex pass.
+    - Remove very short words.
+    - Tokenize, then apply stemming and lemmatization to the whole batch with 'process_tokens_batch'.
 
     Parameters
     ----------
-    The  text to be fully cleaned
+    The Series of review texts
 
     Returns
     -------
-    The cleaned text
+    A Series of cleaned reviews with the same index
     """
-    text = cleaning_stopwords(text)
-    text = cleaning_punctuations(text)
-    text = cleaning_repeating_chars(text)
-    text = cleaning_urls(text)
-    text = cleaning_numbers(text)
-    text = remove_short_words(text)
-    text = process_tokens(text)
-    return text
+    text = [remove_short_words(cleaning_combined(cleaning_stopwords(review))) for review in reviews]
+    return pd.Series(process_tokens_batch(text), index=reviews.index)
 
 # Sentiment Analysis 
 
+# Parallel Processing
+
+# Smallest number of reviews worth sending to a separate worker process
+MIN_REVIEWS_PER_JOB = 200
+
+# Apply a column-wise function to chunks of a Series in parallel
+def parallel_apply(series: pd.Series, func: Callable, n_jobs: int = -1):
+    """
+    Splits the Series into one chunk per worker and applies the function to every chunk in parallel.
+
+    Steps
+    -----
+    - Work out the number of chunks from the available workers and MIN_REVIEWS_PER_JOB.
+    - If there is only one chunk, apply the function directly without starting workers.
+    - Otherwise split the Series by position and run the function on each chunk with joblib.
+    - Concatenate the results back in the original order.
+
+    Parameters
+    ----------
+    series : The Series to process
+    func : A function taking a Series and returning a Series or DataFrame with the same index
+    n_jobs : Number of worker processes, -1 uses every core
+
+    Returns
+    -------
+    The combined result of the function over the whole Series
+    """
+    n_chunks = min(effective_n_jobs(n_jobs), len(series) // MIN_REVIEWS_PER_JOB)
+    if n_chunks <= 1:
+        return func(series)
+
+    chunks = [series.iloc[positions] for positions in np.array_split(np.arange(len(series)), n_chunks)]
+    results = Parallel(n_jobs=n_jobs, backend="loky")(delayed(func)(chunk) for chunk in chunks)
+    return pd.concat(results)
+
+# Sentiment categories, ordered from most negative to most positive
+SENTIMENT_LABELS = ['Negative', 'Neutral', 'Positive']
+
 # Get Subjectivity Score
 def get_subjectivity(text: str) -> float:
     """
@@ -142,6 +223,20 @@ def get_polarity(text: str) -> float:
     """
     return TextBlob(text).sentiment.polarity
 
+# Get Polarity and Subjectivity Scores
+def get_sentiment(text: str) -> Tuple[float, float]:
+    """
+    Returns the polarity and subjectivity scores of the text using TextBlob
+    Both scores come from a single TextBlob analysis of the text
+    """
+    sentiment = TextBlob(text).sentiment
+    return sentiment.polarity, sentiment.subjectivity
+
+# Get Polarity and Subjectivity Scores for a column of texts
+def score_sentiment(texts: pd.Series) -> pd.DataFrame:
+    """Returns a DataFrame with the Polarity and Subjectivity of every text, keeping the index."""
+    return pd.DataFrame(texts.apply(get_sentiment).tolist(), index=texts.index, columns=["Polarity", "Subjectivity"])
+
 # Get Sentiment Label
 def get_sentiment_label(score: float) -> str:
     """Classifies sentiment based on polarity score"""
@@ -153,20 +248,23 @@ def get_sentiment_label(score: float) -> str:
         return 'Positive'
 
 # NLP Pipeline
-def nlp_pipeline(df: pd.DataFrame, review_column: str = "Review_Text") -> pd.DataFrame:
+def nlp_pipeline(df: pd.DataFrame, review_column: str = "Review_Text", n_jobs: int = -1) -> pd.DataFrame:
     """
     This function ensure the whole pipeline is applied to the reviews
 
     Steps
     -------
-    - Calls the full_cleaning function to clean the review text, tokenizes and processes tokens (stemming and lemmatization).
-    - Calls the get_subjectivity function to compute the subjectivity of the text.
-    - Calls the get_polarity function to compute the polarity of the text.
-    - Classifies the sentiment.
+    - Calls the clean_reviews function to clean the review text, tokenizes and processes tokens (stemming and lemmatization).
+    - Splits the cleaned text into a 'Tokens' list column once, for the word clouds and topic modelling to reuse.
+    - Calls the get_sentiment function to compute the polarity and subjectivity of the text in one pass.
+    - Both steps are split into chunks of rows and run across worker processes with 'parallel_apply'.
+    - Classifies the sentiment for the whole Polarity column at once, stored as a categorical column.
 
     Parameters
     ----------
     The input DataFrame containing review data
+    The name of the column with the review text
+    The number of worker processes, by default every core
 
     Returns
     -------
@@ -176,30 +274,29 @@ def nlp_pipeline(df: pd.DataFrame, review_column: str = "Review_Text") -> pd.Dat
     -------------
     processed_data = nlp_pipeline(data= data, review_column='Review_Text')
     """
-    df["Clean_Review"] = df[review_column].apply(full_cleaning)
-    df["Subjectivity"] = df["Clean_Review"].apply(get_subjectivity)
-    df["Polarity"] = df["Clean_Review"].apply(get_polarity)
-    df["Sentiment"] = df["Polarity"].apply(get_sentiment_label)
+    df["Clean_Review"] = parallel_apply(df[review_column], clean_reviews, n_jobs=n_jobs)
+    df["Tokens"] = df["Clean_Review"].str.split()
+    df[["Polarity", "Subjectivity"]] = parallel_apply(df["Clean_Review"], score_sentiment, n_jobs=n_jobs)
+    polarity = df["Polarity"]
+    df["Sentiment"] = pd.Categorical(np.select([polarity < 0, polarity > 0], ['Negative', 'Positive'], default='Neutral'),
+                                     categories=SENTIMENT_LABELS)
     return df
 
 # Create DataFrames for Positive, Negative, and Neutral Reviews
 def create_sentiment_dataframes(df: pd.DataFrame):
-    """Create separate DataFrames for positive, negative, and neutral reviews."""
-    df_positive = df[df['Sentiment'] == 'Positive']
-    df_negative = df[df['Sentiment'] == 'Negative']
-    df_neutral = df[df['Sentiment'] == 'Neutral']
-    return df_positive, df_negative, df_neutral
+    """Create separate DataFrames for positive, negative, and neutral reviews, splitting the data in a single groupby pass."""
+    groups = dict(tuple(df.groupby('Sentiment', sort=False, observed=True)))
+    empty = df.iloc[:0]
+    return groups.get('Positive', empty), groups.get('Negative', empty), groups.get('Neutral', empty)
 
 # Calculate and Display Sentiment Percentages
-def calculate_sentiment_percentage(df_positive: pd.DataFrame, df_negative: pd.DataFrame, df_neutral: pd.DataFrame, df: pd.DataFrame) -> None:
-    """Calculate and display the percentage of positive, negative, and neutral reviews."""
-    positive_percentage = round((df_positive.shape[0] / df.shape[0]) * 100, 1)
-    negative_percentage = round((df_negative.shape[0] / df.shape[0]) * 100, 1)
-    neutral_percentage = round((df_neutral.shape[0] / df.shape[0]) * 100, 1)
+def calculate_sentiment_percentage(df: pd.DataFrame) -> None:
+    """Calculate and display the percentage of positive, negative, and neutral reviews from the Sentiment column in one pass."""
+    percentages = df['Sentiment'].value_counts(normalize=True).reindex(SENTIMENT_LABELS, fill_value=0) * 100
     
-    print(f"Positive Reviews: {positive_percentage}%")
-    print(f"Negative Reviews: {negative_percentage}%")
-    print(f"Neutral Reviews: {neutral_percentage}%")
+    print(f"Positive Reviews: {round(percentages['Positive'], 1)}%")
+    print(f"Negative Reviews: {round(percentages['Negative'], 1)}%")
+    print(f"Neutral Reviews: {round(percentages['Neutral'], 1)}%")
 
 # Analyse Verification Status
 def analyse_verification_status(data: pd.DataFrame) -> None:
@@ -209,10 +306,10 @@ def analyse_verification_status(data: pd.DataFrame) -> None:
     Steps
     -----
     - Calculate the total number of reviews.
-    - Count the number of verified and non-verified reviews.
+    - Count the number of verified and non-verified reviews with a single value_counts.
     - Calculate the percentage of verified and non-verified reviews.
     - Print the verification status.
-    - Check non-verified reviews among negative sentiment
+    - Check non-verified reviews among negative sentiment, using one sentiment/verification crosstab.
 
     Parameters
     ----------
@@ -227,8 +324,9 @@ def analyse_verification_status(data: pd.DataFrame) -> None:
     analyse_verification_status(processed_data)
     """
     total_reviews = len(data)
-    verified_reviews = data['Verified'].value_counts().get('✅ Trip Verified', 0)
-    non_verified_reviews = data['Verified'].value_counts().get('Not Verified', 0)
+    verification_counts = data['Verified'].value_counts()
+    verified_reviews = verification_counts.get('✅ Trip Verified', 0)
+    non_verified_reviews = verification_counts.get('Not Verified', 0)
     verified_percentage = round((verified_reviews / total_reviews) * 100, 1)
     non_verified_percentage = round((non_verified_reviews / total_reviews) * 100, 1)
     
@@ -237,14 +335,21 @@ def analyse_verification_status(data: pd.DataFrame) -> None:
     print(f"Verified Reviews: {verified_reviews} ({verified_percentage}%)")
     print(f"Non-Verified Reviews: {non_verified_reviews} ({non_verified_percentage}%)")
     
-    negative_reviews = data[data['Sentiment'] == 'Negative']
-    negative_non_verified = negative_reviews[negative_reviews['Verified'] == 'Not Verified']
-    negative_non_verified_percentage = round((len(negative_non_verified) / len(negative_reviews)) * 100, 1)
+    # Verification counts for negative reviews (zeros if there are none)
+    sentiment_verification = pd.crosstab(data['Sentiment'], data['Verified'])
+    negative_counts = sentiment_verification.reindex(index=['Negative'], fill_value=0).iloc[0]
+    negative_reviews = negative_counts.sum()
+    negative_non_verified = negative_counts.get('Not Verified', 0)
+    negative_non_verified_percentage = round((negative_non_verified / negative_reviews) * 100, 1) if negative_reviews else 0.0
     
     print("\nNon-Verified Reviews Among Negative Sentiment:")
-    print(f"Total Negative Reviews: {len(negative_reviews)}")
-    print(f"Non-Verified Negative Reviews: {len(negative_non_verified)} ({negative_non_verified_percentage}%)")
+    print(f"Total Negative Reviews: {negative_reviews}")
+    print(f"Non-Verified Negative Reviews: {negative_non_verified} ({negative_non_verified_percentage}%)")
     
+# Keywords relating to delays and cancellations, matched as whole words
+DELAY_KEYWORDS = ["delay", "delayed", "late", "cancellation", "cancelled"]
+DELAY_PATTERN = re.compile(r"\b(?:" + "|".join(DELAY_KEYWORDS) + r")\b", re.IGNORECASE)
+
 # Analyse Delays
 def analyse_delays(data):
     """
@@ -253,12 +358,9 @@ def analyse_delays(data):
 
     Steps
     -----
-        - Define a list of keywords.
-        - Filter the DataFrame to include only reviews with negative sentiment.
-        - Create a dictionary to store the count of delay keywords for each airline.
-        - Iterate through the negative reviews and count the delay keywords for each airline.
-        - Update the dictionary with the keyword counts.
-        - Convert the dictionary into a DataFrame with airlines and their delay keyword counts.
+        - Mask out the cleaned text of reviews without negative sentiment (no sub-DataFrame is built).
+        - Count the occurrences of DELAY_PATTERN in every negative review in one vectorized pass.
+        - Sum the keyword counts per airline with a single groupby, keeping airlines with negative reviews.
 
     Parameters
     ----------
@@ -272,23 +374,10 @@ def analyse_delays(data):
     -------------
     analyse_data(data= data)
     """
-    delay_keywords = ["delay", "delayed", "late", "cancellation", "cancelled"]
-    df_negative = data[data['Sentiment'] == 'Negative']
+    keyword_counts = data['Clean_Review'].where(data['Sentiment'] == 'Negative').str.count(DELAY_PATTERN.pattern, flags=DELAY_PATTERN.flags)
 
-    airline_keyword_counts = {}
-
-    for index, row in df_negative.iterrows():
-        airline = row['Airline Name']
-        review_text = row['Clean_Review'].lower()
-
-        keyword_count = sum(1 for keyword in delay_keywords if keyword in review_text.split())
-
-        airline_keyword_counts.setdefault(airline, 0)  
-        airline_keyword_counts[airline] += keyword_count
-
-    result_df = pd.DataFrame(list(airline_keyword_counts.items()), columns=['Airline Name', 'Delay_Keyword_Count'])
+    # min_count=1 leaves airlines without negative reviews as NaN, so they can be dropped
+    delay_counts = keyword_counts.groupby(data['Airline Name'], sort=False, observed=True).sum(min_count=1).dropna()
+    result_df = delay_counts.astype(int).rename('Delay_Keyword_Count').reset_index()
 
     return result_df
-        
-
-
@@ -1,7 +1,13 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import List
+import pandas as pd
 from scraping import scrape_reviews_from_file, airlines
 
+# Columns of the consolidated reviews DataFrame
+review_columns = ["Airline Name", "Title", "Rating", "Verified", "Review_Text"]
+
 # Processes airline reviews from local HTML files
 def process_airline_reviews(airline: str) -> List[List[str]]:
     """
@@ -14,7 +20,7 @@ def process_airline_reviews(airline: str) -> List[List[str]]:
       - Check File Existence:
           - If file exists → Calls 'scrape_reviews_from_file' to extract reviews
           - If not exists → Prints error message
-      - Label and append each extracted review with the airline name
+      - Label each extracted review with the airline name
 
 
     Returns:
@@ -28,43 +34,41 @@ def process_airline_reviews(airline: str) -> List[List[str]]:
     formatted_airline = airline.lower().replace(" ", "-")
     
     file_path = "data/" + formatted_airline + ".html"
-                
-    airline_reviews = []
 
     if os.path.exists(file_path):
         print(f"Extracting reviews for {airline}")
 
         extracted_reviews = scrape_reviews_from_file(file_path)
-
-        for review in extracted_reviews:
-            airline_reviews.append([airline] + review)
         print(f"Found reviews for {airline}: {len(extracted_reviews)}")
-    else:
-        print(f"File not found for {airline}")
 
-    return airline_reviews
+        return [[airline] + review for review in extracted_reviews]
 
-# Consolidates reviews from all airlines into a single list
-def consolidate_reviews() -> List[List[str]]:
+    print(f"File not found for {airline}")
+    return []
+
+# Consolidates reviews from all airlines into a single DataFrame
+def consolidate_reviews() -> pd.DataFrame:
     """
-    Consolidates into a list all the individual reviews from airlines.
+    Consolidates into a single DataFrame all the individual reviews from airlines.
 
     Steps
     -------
-    - Iterate Airlines: Loops through the list of airlines.
-    - Process Reviews: Calls the 'process_airline_reviews' function for each airline to extract reviews.
-    - Extend Reviews: Adds the extracted reviews to a main list.
+    - Process Reviews: Calls the 'process_airline_reviews' function for every airline in a thread pool.
+      The HTML parser releases the GIL, so the files are parsed in parallel.
+    - Build DataFrame: Chains the reviews airline by airline, in the order of the airlines list,
+      straight into a DataFrame, without building a main list.
+    - Convert the rating to a number ("No Rating" becomes NaN).
 
     Returns
     -------
-    A consolidated list of all reviews for every airline.
+    A DataFrame with the columns 'Airline Name', 'Title', 'Rating', 'Verified' and 'Review_Text'.
 
     Example Usage
     -------------
     all_reviews = consolidate_reviews()
     """
-    all_reviews = []
-    for airline in airlines:
-        reviews = process_airline_reviews(airline)
-        all_reviews.extend(reviews)
-    return all_reviews
\ No newline at end of file
+    with ThreadPoolExecutor() as executor:
+        df = pd.DataFrame(chain.from_iterable(executor.map(process_airline_reviews, airlines)), columns=review_columns)
+
+    df["Rating"] = pd.to_numeric(df["Rating"], errors="coerce")
+    return df
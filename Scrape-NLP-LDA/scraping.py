@@ -1,7 +1,8 @@
-import requests
+import asyncio
+import httpx
 import os
-from bs4 import BeautifulSoup
-import time
+from itertools import islice
+from selectolax.lexbor import LexborHTMLParser
 from typing import List
 
 # List of specific airlines
@@ -11,20 +12,82 @@ airlines = [ "British Airways", "Lufthansa", "Emirates", "Qatar", "Singapore Air
 # Defining the url of the site
 base_url = "https://www.airlinequality.com/airline-reviews/{airline}/"
 
-# Download and save HTML files for individual airline review pages
-def download_airline_reviews() -> None:
+# Maximum number of review pages fetched at the same time
+max_concurrent_downloads = 8
+
+# Class of the <article> tags holding a single review
+review_class = "comp_media-review-rated"
+
+# Write downloaded HTML content to disk
+def save_html(file_path: str, html: str) -> None:
+    """Save the HTML content to the given file path with UTF-8 encoding."""
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(html)
+
+# Download and save the HTML file for a single airline review page
+async def fetch_airline_reviews(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, airline: str) -> None:
     """
-    Downloads the HTML content of individual airline review pages and saves them locally.
+    Downloads the HTML content of one airline review page and saves it locally.
 
     Steps
     -------
     - Format Airline Name: Converts the airline name to lowercase and replaces spaces with hyphens.
     - Construct URL: Inserts the formatted airline name into the base URL.
-    - Send HTTP Requesst: Sends a GET request to download the HTML content.
+    - Send HTTP Request: Waits for a free slot in the semaphore, then sends a GET request with the shared client.
     - Check response:
       -  If request is successful (code == 200) → Saves the HTML content named after the formatted airline.
       -  If not successful → Prints error message and the status code.
 
+    Parameters
+    ----------
+    client : The shared asynchronous HTTP client.
+    semaphore : Limits how many pages are requested at once.
+    airline : The name of the airline to download.
+
+    Returns
+    -------
+    None
+    """
+    formatted_airline = airline.lower().replace(" ", "-")
+    url = base_url.replace("{airline}", formatted_airline)
+
+    async with semaphore:
+        response = await client.get(url)
+
+    if response.status_code == 200:
+        print(f"Downloading HTML for {airline}")
+
+        await asyncio.to_thread(save_html, f"data/{formatted_airline}.html", response.text)
+        print(f"HTML file saved for {airline}")
+    else:
+        print(f"Failed to retrieve HTML for {airline} (Status code: {response.status_code})")
+
+# Download every airline review page concurrently
+async def download_all_airline_reviews() -> None:
+    """
+    Opens one shared HTTP/2 client and downloads all airline review pages concurrently,
+    with at most 'max_concurrent_downloads' requests in flight.
+    The client pools its connections and retries failed connection attempts.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent_downloads)
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=3,
+                                         limits=httpx.Limits(max_connections=max_concurrent_downloads))
+
+    async with httpx.AsyncClient(transport=transport, timeout=30) as client:
+        await asyncio.gather(*[fetch_airline_reviews(client, semaphore, airline) for airline in airlines])
+
+# Download and save HTML files for individual airline review pages
+def download_airline_reviews() -> None:
+    """
+    Downloads the HTML content of individual airline review pages and saves them locally.
+
+    Steps
+    -------
+    - Start an event loop and run 'download_all_airline_reviews'.
+    - Each airline page is fetched by 'fetch_airline_reviews', so the requests overlap
+      instead of waiting for one another.
+    - Files are written in a worker thread to keep the event loop free.
+
     This refined approach targets individual review pages rather than extracting reviews from a single aggregated page,
     ensuring accurate data collection for each airline.
 
@@ -36,36 +99,27 @@ def download_airline_reviews() -> None:
     -------------
     download_airline_reviews()
     """
-
-    for airline in airlines:
-        formatted_airline = airline.lower().replace(" ", "-")
-        url = base_url.replace("{airline}", formatted_airline)
-
-        response = requests.get(url)
-        if response.status_code == 200:
-            print(f"Downloading HTML for {airline}")
-
-            with open(f"data/{formatted_airline}.html", "w", encoding="utf-8") as file:
-                file.write(response.text)
-            print(f"HTML file saved for {airline}")
-        else:
-            print(f"Failed to retrieve HTML for {airline} (Status code: {response.status_code})")
+    asyncio.run(download_all_airline_reviews())
 
 # Scrape reviews from the extracted file
 def scrape_reviews_from_file(file_path: str, max_reviews: int = 20) -> List[List[str]]:
     """
    Extracts airline reviews from an HTML file.
-    A 5-second delay is introduced between iterations to comply with ethical web scraping practices.
+    The file is read from disk, so no delay is needed here; concurrent requests to the site are capped
+    in 'download_airline_reviews'.
 
     Steps
     -------
-    - Open the specified HTML file with UTF-8 encoding.
-    - Parse the file's content using BeautifulSoup.
-    - Finds all <article> tags with class 'comp_media-review-rated'.
-    - For each review (up to 'max_reviews'):
+    - Open the specified HTML file as raw UTF-8 bytes.
+    - Skip the page head and navigation, parsing only from the first review <article> onwards
+      with the selectolax Lexbor parser.
+    - Iterate over the <article> tags with class 'comp_media-review-rated', stopping after 'max_reviews'.
+    - For each review:
         - Extracts the title from <h2> tag, or return "No Title" if missing..
         - Extracts the rating (first character from a <div> with class "rating-10", or "No Rating").
         - Extract the review text from the <div> with class "text_content" (or "No Review").
+        - If the review text starts with the verification badge (a <strong> tag followed by "|"),
+          split it off as the verification status; otherwise, mark the review as "Not Verified".
     - Append the extracted data into a list.
 
     Parameters
@@ -75,7 +129,7 @@ def scrape_reviews_from_file(file_path: str, max_reviews: int = 20) -> List[List
 
     Returns
     -------
-    A list of reviews, where each review is a list: [Airline Name, title, rating, review_text].
+    A list of reviews, where each review is a list: [title, rating, verified, review_text].
 
     Example Usage
     -------------
@@ -83,22 +137,32 @@ def scrape_reviews_from_file(file_path: str, max_reviews: int = 20) -> List[List
     """
     reviews = []
 
-    with open(file_path, "r", encoding="utf-8") as file:
-        soup = BeautifulSoup(file, "html.parser")
-        articles = soup.find_all("article", class_="comp_media-review-rated")
+    with open(file_path, "rb") as file:
+        html = file.read()
+
+    # Everything before the first review (head, scripts, navigation) is irrelevant, so it is not parsed.
+    # This relies on the review class name first appearing on a review <article> tag.
+    first_review = html.find(review_class.encode())
+    start = max(html.rfind(b"<article", 0, first_review), 0) if first_review != -1 else 0
+    tree = LexborHTMLParser(html[start:])
 
-        for article in articles[:max_reviews]:
-            time.sleep(5)
+    for article in islice(tree.css(f"article.{review_class}"), max_reviews):
+        title_element = article.css_first("h2")
+        title = title_element.text() if title_element else "No Title"
 
-            title_element = article.find("h2")
-            title = title_element.text if title_element else "No Title"
+        rating_element = article.css_first("div.rating-10")
+        rating = rating_element.text().strip()[0] if rating_element and rating_element.text().strip() else "No Rating"
 
-            rating_element = article.find("div", class_="rating-10")
-            rating = rating_element.text.strip()[0] if rating_element and rating_element.text.strip() else "No Rating"
+        review_text_element = article.css_first("div.text_content")
+        review_text = review_text_element.text() if review_text_element else "No Review"
 
-            review_text_element = article.find("div", class_="text_content")
-            review_text = review_text_element.text if review_text_element else "No Review"
+        # Separate the verification badge from the review itself
+        verified = "Not Verified"
+        if review_text_element and review_text_element.css_first("strong") and "|" in review_text:
+            verified, review_text = review_text.split("|", 1)
+            verified = verified.strip()
+        review_text = review_text.strip()
 
-            reviews.append([title, rating, review_text])
+        reviews.append([title, rating, verified, review_text])
     return reviews
 
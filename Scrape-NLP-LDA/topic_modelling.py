@@ -1,3 +1,5 @@
+import math
+import os
 from typing import Tuple, List
 import pandas as pd
 from gensim import corpora
@@ -7,6 +9,9 @@ import pyLDAvis.gensim_models
 import matplotlib.pyplot as plt
 import webbrowser
 
+# LDA training stops scaling beyond about four worker processes
+MAX_LDA_WORKERS = 4
+
 # Topic Modeling with LDA
 def preprocess_for_topic_modelling(data, review_column="Clean_Review"):
     """
@@ -14,8 +19,8 @@ def preprocess_for_topic_modelling(data, review_column="Clean_Review"):
 
    Steps
     -----
-    - Get the cleaned reviews from the specified column in the DataFrame.
-    - Convert the list of cleaned reviews (already tokenized) into a format suitable for topic modeling.
+    - Get the tokenized reviews from the 'Tokens' column made by 'nlp_pipeline', if present.
+    - Otherwise, split the cleaned reviews from the specified column into tokens.
     - Create a dictionary and a corpus (Bag of Words) directly from the processed reviews.
 
     Parameters
@@ -30,9 +35,10 @@ def preprocess_for_topic_modelling(data, review_column="Clean_Review"):
     -------------
     preprocess_for_topic_modelling(data= data, review_column='Clean_Review')
     """
-    processed_reviews = data[review_column].tolist()
-
-    processed_reviews = [review.split() for review in processed_reviews]
+    if "Tokens" in data.columns:
+        processed_reviews = data["Tokens"].tolist()
+    else:
+        processed_reviews = [review.split() for review in data[review_column]]
 
     dictionary = corpora.Dictionary(processed_reviews)
     corpus = [dictionary.doc2bow(review) for review in processed_reviews]
@@ -47,7 +53,9 @@ def apply_lda_model(corpus, dictionary, num_topics=5):
     Steps
     -----
     - Set the number of topics to find.
-    - Initialise the LDA model with the given corpus, dictionary, and number of topics.
+    - Use one worker per core (leaving one core free), up to MAX_LDA_WORKERS.
+    - Size the chunks so that every worker gets part of the corpus, up to 2000 documents per chunk.
+    - Initialise the multicore LDA model with the given corpus, dictionary, and number of topics.
     - Train the model with multiple passes over the corpus.
     - Display the top words for each identified topic.
 
@@ -67,9 +75,12 @@ def apply_lda_model(corpus, dictionary, num_topics=5):
     """
 
     num_topics = 7
+    workers = max(1, min((os.cpu_count() or 1) - 1, MAX_LDA_WORKERS))
+    chunksize = min(2000, max(1, math.ceil(len(corpus) / workers)))
     lda_model = gensim.models.LdaMulticore(corpus, num_topics=num_topics,
                                           id2word=dictionary, passes=10,
-                                          workers=2)
+                                          iterations=50, chunksize=chunksize,
+                                          workers=workers)
 
     topics = lda_model.show_topics(num_topics=num_topics, num_words=5, formatted=False)
 
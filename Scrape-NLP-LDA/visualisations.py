@@ -1,106 +1,422 @@
+import hashlib
+import json
+import os
+from collections import Counter
+from itertools import chain
+import matplotlib
+
+# Render off-screen with the Agg backend for non-interactive runs (set HEADLESS=1)
+if os.environ.get("HEADLESS"):
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt 
+import numpy as np
 import pandas as pd
 import seaborn as sns
 from wordcloud import WordCloud
 
+# Settings shared by every word cloud, and the order the sentiment panels are drawn in
+WORDCLOUD_SETTINGS = {"width": 800, "height": 500, "random_state": 42, "max_font_size": 100}
+WORDCLOUD_SENTIMENTS = ["Positive", "Negative", "Neutral"]
+
+# Directory next to the scraped data where generated word clouds are cached between runs,
+# and the number of cached clouds kept there (the least recently used ones are removed first)
+WORDCLOUD_CACHE_DIR = "data/wordcloud_cache"
+WORDCLOUD_CACHE_MAX_ENTRIES = 12
+
+# Grouping columns cast to categorical, so groupby, value_counts and seaborn work on integer codes
+CATEGORICAL_COLUMNS = ["Airline Name", "Sentiment"]
+
+# Cast grouping columns to categorical
+def to_categorical(data: pd.DataFrame, columns: list = CATEGORICAL_COLUMNS) -> pd.DataFrame:
+    """Return the data with the given columns cast to the category dtype, leaving the input unchanged."""
+    casts = {col: data[col].astype('category') for col in columns
+             if col in data.columns and not isinstance(data[col].dtype, pd.CategoricalDtype)}
+    return data.assign(**casts) if casts else data
+
+# Figure reused by the plots that are drawn on their own
+_FIG = None
+
+# Get the shared figure, cleared and resized for the next plot
+def _get_fig(figsize: tuple):
+    """
+    Return the module's shared figure, cleared and resized to 'figsize', so single plots do not pay
+    for a new figure each time. A new figure is created on first use or after the previous one was closed.
+    """
+    global _FIG
+    if _FIG is None or not plt.fignum_exists(_FIG.number):
+        _FIG = plt.figure(figsize=figsize)
+    else:
+        _FIG.clf()
+        _FIG.set_size_inches(figsize)
+    return _FIG
+
+# Show a finished plot, or save it when a path is given
+def finish_figure(fig, show: bool, save_path: str = None, ax=None) -> None:
+    """
+    Save the figure to 'save_path' if given, otherwise show it when the plot owns its figure ('show').
+    If the plot was drawn on 'ax' inside a larger figure, only the area of that panel is saved.
+    Saving to a .svg or .pdf path writes vector output, skipping rasterization of the bars and boxes.
+    A figure created only for saving is closed afterwards.
+    """
+    if save_path:
+        bbox = 'tight'
+        if ax is not None and not show:
+            # Lay out the figure first, so the panel is cropped where it will actually be drawn
+            fig.draw_without_rendering()
+            bbox = ax.get_tightbbox().transformed(fig.dpi_scale_trans.inverted()).padded(0.1)
+        fig.savefig(save_path, bbox_inches=bbox)
+        if show:
+            plt.close(fig)
+    elif show:
+        plt.show()
+
+# Count word frequencies for each sentiment
+def count_word_frequencies(df: pd.DataFrame, sentiment_col: str = 'Sentiment') -> dict:
+    """
+    Counts how often each word appears in the cleaned reviews of each sentiment.
+
+    Steps
+    -----
+    - Use the 'Tokens' column made once by 'nlp_pipeline' (or split 'Clean_Review' if it is missing).
+    - Group the token lists by sentiment and count each group's tokens with a Counter over the chained lists,
+      without joining the reviews into one string.
+
+    Parameters
+    ----------
+    df : The processed DataFrame with the 'Tokens' or 'Clean_Review' column.
+    sentiment_col : The column holding the sentiment labels.
+
+    Returns
+    -------
+    A dictionary mapping each sentiment with at least one word to a {word: count} Counter.
+
+    Example Usage
+    -------------
+    frequencies = count_word_frequencies(df_processed)
+    """
+    tokens = df['Tokens'] if 'Tokens' in df.columns else df['Clean_Review'].str.split()
+
+    frequencies = {sentiment: Counter(chain.from_iterable(group))
+                   for sentiment, group in tokens.groupby(df[sentiment_col], sort=False, observed=True)}
+    return {sentiment: frequencies[sentiment] for sentiment in WORDCLOUD_SENTIMENTS if frequencies.get(sentiment)}
+
+# Keep only the most recently used word clouds in the cache
+def prune_word_cloud_cache(cache_dir: str = WORDCLOUD_CACHE_DIR, max_entries: int = WORDCLOUD_CACHE_MAX_ENTRIES) -> None:
+    """Delete the least recently used cached word clouds until at most 'max_entries' are left."""
+    entries = sorted((entry for entry in os.scandir(cache_dir) if entry.name.endswith(".npy")),
+                     key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[max_entries:]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+# Render a word cloud image, reusing a cached one when the words have not changed
+def cached_word_cloud(wordcloud: WordCloud, frequencies: dict, cache_dir: str = WORDCLOUD_CACHE_DIR) -> np.ndarray:
+    """
+    Returns the word cloud image for the given word frequencies, loading it from 'cache_dir' when possible.
+
+    Steps
+    -----
+    - Hash the word cloud settings and the sorted frequencies into a stable key (survives restarts).
+    - If an image with that key is cached on disk, mark it as recently used and load it instead of recomputing the layout.
+    - Otherwise, lay out the words with the given (reused) WordCloud and save the image under the key
+      (written to a temporary file first, so an interrupted run never leaves a broken cache entry).
+    - Prune the cache to the 'WORDCLOUD_CACHE_MAX_ENTRIES' most recently used clouds.
+
+    Parameters
+    ----------
+    wordcloud : The WordCloud to lay out the words with, built from 'WORDCLOUD_SETTINGS'.
+    frequencies : A {word: count} dictionary.
+    cache_dir : The directory holding the cached word clouds.
+
+    Returns
+    -------
+    The word cloud image as an RGB array.
+
+    Example Usage
+    -------------
+    image = cached_word_cloud(WordCloud(**WORDCLOUD_SETTINGS), {'flight': 105, 'seat': 46})
+    """
+    payload = json.dumps([WORDCLOUD_SETTINGS, sorted(frequencies.items())]).encode("utf-8")
+    cache_path = os.path.join(cache_dir, hashlib.blake2b(payload, digest_size=16).hexdigest() + ".npy")
+
+    if os.path.exists(cache_path):
+        os.utime(cache_path)
+        return np.load(cache_path)
+
+    # The reused WordCloud shares one Random across calls, so reseed it to make every image independent
+    # of the clouds laid out (or loaded from the cache) before it
+    wordcloud.random_state.seed(WORDCLOUD_SETTINGS["random_state"])
+    # to_array renders a new array, so the image stays intact when the WordCloud is reused
+    image = wordcloud.generate_from_frequencies(frequencies).to_array()
+
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        np.save(file, image)
+    os.replace(temp_path, cache_path)
+    prune_word_cloud_cache(cache_dir)
+
+    return image
+
 # Generate Word Clouds for Sentiment
-def generate_word_clouds(df_positive: pd.DataFrame, df_negative: pd.DataFrame, df_neutral: pd.DataFrame) -> None:
+def generate_word_clouds(df: pd.DataFrame, sentiment_col: str = 'Sentiment', axes=None,
+                         cache_dir: str = WORDCLOUD_CACHE_DIR) -> None:
     """
     Generates and displays word clouds for positive, negative, and neutral reviews.
-    """
-    positive_reviews = ' '.join(df_positive['Clean_Review'])
-    negative_reviews = ' '.join(df_negative['Clean_Review'])
-    neutral_reviews = ' '.join(df_neutral['Clean_Review'])
 
-    wordcloud_positive = WordCloud(width=800, height=500, random_state=42, max_font_size=100).generate(positive_reviews)
-    wordcloud_negative = WordCloud(width=800, height=500, random_state=42, max_font_size=100).generate(negative_reviews)
-    wordcloud_neutral = WordCloud(width=800, height=500, random_state=42, max_font_size=100).generate(neutral_reviews)
+    Steps
+    -----
+    - Count the word frequencies of each sentiment with 'count_word_frequencies' (from the precomputed tokens).
+    - Lay out the three word clouds one after the other with a single WordCloud instance,
+      reusing images cached on disk by earlier runs.
+    - Draw them side by side in one figure (or on the given axes); a sentiment without reviews gets an empty panel.
 
-    plt.figure(figsize=(15, 8))
-    plt.imshow(wordcloud_positive, interpolation='bilinear')
-    plt.axis('off')
-    plt.title("Positive Reviews Word Cloud")
-    plt.show()
+    Parameters
+    ----------
+    df : The processed DataFrame with the 'Tokens' (or 'Clean_Review') column.
+    sentiment_col : The column holding the sentiment labels.
+    axes : Three axes to draw the positive, negative and neutral clouds on. If None, the shared figure is used and shown.
+    cache_dir : The directory holding the cached word clouds.
 
-    plt.figure(figsize=(15, 8))
-    plt.imshow(wordcloud_negative, interpolation='bilinear')
-    plt.axis('off')
-    plt.title("Negative Reviews Word Cloud")
-    plt.show()
+    Returns
+    -------
+    None
 
-    plt.figure(figsize=(15, 8))
-    plt.imshow(wordcloud_neutral, interpolation='bilinear')
-    plt.axis('off')
-    plt.title("Neutral Reviews Word Cloud")
-    plt.show()
+    Example Usage
+    -------------
+    generate_word_clouds(df_processed)
+    """
+    frequencies = count_word_frequencies(df, sentiment_col)
+
+    wordcloud = WordCloud(**WORDCLOUD_SETTINGS)
+    images = {sentiment: cached_word_cloud(wordcloud, words, cache_dir) for sentiment, words in frequencies.items()}
+
+    show = axes is None
+    if show:
+        axes = _get_fig((24, 6)).subplots(1, len(WORDCLOUD_SENTIMENTS))
+    for ax, sentiment in zip(axes, WORDCLOUD_SENTIMENTS):
+        if sentiment in images:
+            # The cloud is already rendered at its target size, so no resampling is needed
+            ax.imshow(images[sentiment], interpolation='nearest', rasterized=True)
+        ax.axis('off')
+        ax.set_title(f"{sentiment} Reviews Word Cloud")
+    finish_figure(axes[0].figure, show)
+
+# Largest number of reviews drawn as individual points in the polarity/subjectivity plot
+SCATTER_MAX_POINTS = 5000
 
 # Plot Polarity vs Subjectivity
-def plot_polarity_subjectivity(df: pd.DataFrame) -> None:
-    """Plot polarity vs subjectivity of the reviews."""
-    plt.figure(figsize=(8,6))
-    plt.scatter(df["Polarity"], df["Subjectivity"], color='blue')
-    plt.title("Sentiment Analysis: Polarity vs Subjectivity")
-    plt.xlabel("Polarity")
-    plt.ylabel("Subjectivity")
-    plt.show()
+def plot_polarity_subjectivity(df: pd.DataFrame, ax=None) -> None:
+    """
+    Plot polarity vs subjectivity of the reviews, on 'ax' if given or else in the shared figure.
+    Above 'SCATTER_MAX_POINTS' reviews, a hexbin density plot is drawn instead of one marker per review.
+    """
+    show = ax is None
+    if show:
+        ax = _get_fig((8, 6)).add_subplot(111)
+    if len(df) > SCATTER_MAX_POINTS:
+        hexbins = ax.hexbin(df["Polarity"], df["Subjectivity"], gridsize=50, cmap='Blues')
+        ax.figure.colorbar(hexbins, ax=ax, label='Reviews')
+    else:
+        ax.scatter(df["Polarity"], df["Subjectivity"], color='blue')
+    ax.set_title("Sentiment Analysis: Polarity vs Subjectivity")
+    ax.set_xlabel("Polarity")
+    ax.set_ylabel("Subjectivity")
+    finish_figure(ax.figure, show)
 
 # Plot Sentiment Counts
-def plot_sentiment_counts(df: pd.DataFrame) -> None:
-    """Create a bar chart to visualise the sentiment distribution."""
-    plt.figure(figsize=(8,6))
-    df['Sentiment'].value_counts().plot(kind='bar')
-    plt.title('Sentiment Av.nalysis')
-    plt.xlabel('Sentiment')
-    plt.ylabel('Count')
-    plt.show()  
+def plot_sentiment_counts(df: pd.DataFrame, ax=None, save_path: str = None) -> None:
+    """
+    Create a bar chart to visualise the sentiment distribution, on 'ax' if given or else in the shared figure.
+    The categorical codes are counted with np.bincount. Set 'save_path' (e.g. .svg or .pdf) to save instead of show.
+    """
+    sentiment = to_categorical(df)['Sentiment']
+    codes = sentiment.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(sentiment.cat.categories))
+
+    show = ax is None
+    if show:
+        ax = _get_fig((8, 6)).add_subplot(111)
+    ax.bar(sentiment.cat.categories.astype(str), counts)
+    ax.set_title('Sentiment Analysis')
+    ax.set_xlabel('Sentiment')
+    ax.set_ylabel('Count')
+    finish_figure(ax.figure, show, save_path, ax)
     
+# Quantiles drawn by the polarity boxplot: whisker low, lower quartile, median, upper quartile, whisker high
+BOXPLOT_QUANTILES = [0, 0.25, 0.5, 0.75, 1]
+
+# Per-group quantiles from integer group codes
+def group_quantiles(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Computes the 'BOXPLOT_QUANTILES' of the values in each group, sorting the values by group only once.
+
+    Steps
+    -----
+    - Argsort the group codes once, so the values of every group become one contiguous slice.
+    - Find the slice boundaries of all groups with a single searchsorted.
+    - Compute the quantiles of each slice; groups without values get a row of NaN.
+
+    Parameters
+    ----------
+    codes : Group code (0 to n_groups - 1) of every value.
+    values : The float values to summarise.
+    n_groups : The number of groups.
+
+    Returns
+    -------
+    An array of shape (n_groups, 5) with the quantiles of each group.
+
+    Example Usage
+    -------------
+    quantiles = group_quantiles(airlines.cat.codes.to_numpy(), polarity, len(airlines.cat.categories))
+    """
+    order = np.argsort(codes, kind='stable')
+    sorted_values = values[order]
+    boundaries = np.searchsorted(codes[order], np.arange(n_groups + 1))
+
+    quantiles = np.full((n_groups, len(BOXPLOT_QUANTILES)), np.nan)
+    for group in range(n_groups):
+        start, end = boundaries[group], boundaries[group + 1]
+        if end > start:
+            quantiles[group] = np.quantile(sorted_values[start:end], BOXPLOT_QUANTILES)
+    return quantiles
+
 # Sentiment vs. Airline
-def plot_sentiment_by_airline(data: pd.DataFrame):
-    """Creates a boxplot of review polarity for each airline."""
-    plt.figure(figsize=(10, 6))
-    sns.boxplot(x='Airline Name', y='Polarity', data=data)
-    plt.title('Sentiment Distribution by Airline')
-    plt.xlabel('Airline')
-    plt.ylabel('Polarity')
-    plt.xticks(rotation=45, ha='right')
-    plt.show()
+def plot_sentiment_by_airline(data: pd.DataFrame, ax=None, save_path: str = None):
+    """
+    Creates a boxplot of review polarity for each airline, with whiskers at the minimum and maximum,
+    on 'ax' if given or else in the shared figure.
+    The quartiles are computed from the airline codes with 'group_quantiles' and drawn with matplotlib's 'bxp',
+    so the polarity values are not sorted again per airline when plotting.
+    Set 'save_path' (e.g. .svg or .pdf) to save the plot instead of showing it.
+    """
+    airlines = to_categorical(data)['Airline Name']
+    codes = airlines.cat.codes.to_numpy()
+    # A column taken from a 2-D block can be a strided view, so copy it into one contiguous buffer if needed
+    polarity = np.ascontiguousarray(data['Polarity'].to_numpy(dtype=float, na_value=np.nan))
+    valid = (codes >= 0) & ~np.isnan(polarity)
+
+    quantiles = group_quantiles(codes[valid], polarity[valid], len(airlines.cat.categories))
+    stats = [{'label': airline, 'whislo': row[0], 'q1': row[1], 'med': row[2], 'q3': row[3], 'whishi': row[4]}
+             for airline, row in zip(airlines.cat.categories, quantiles) if not np.isnan(row[0])]
+
+    show = ax is None
+    if show:
+        ax = _get_fig((10, 6)).add_subplot(111)
+    if stats:
+        ax.bxp(stats, showfliers=False)
+    ax.set_title('Sentiment Distribution by Airline')
+    ax.set_xlabel('Airline')
+    ax.set_ylabel('Polarity')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    finish_figure(ax.figure, show, save_path, ax)
 
 # Calculate average rating for each airline (all reviews)
-def plot_average_rating_by_airline(data: pd.DataFrame):
+def plot_average_rating_by_airline(data: pd.DataFrame, ax=None, save_path: str = None):
     """
-    Computes average ratings overall and for negative reviews, then displays a grouped bar chart.
+    Computes average ratings overall and for negative reviews in a single groupby pass, then displays them
+    as a grouped bar chart with one contiguous array of averages per rating type, on 'ax' if given or else
+    in the shared figure.
+    Set 'save_path' (e.g. .svg or .pdf) to save the plot instead of showing it.
     """
-    data = data.copy()
-    data['Rating'] = pd.to_numeric(data['Rating'], errors='coerce')
+    data = to_categorical(data)
 
-    overall_ratings = data.groupby('Airline Name')['Rating'].mean().reset_index()
-    overall_ratings['Rating_Type'] = 'Overall Average'
+    # Only parse the ratings if they were not loaded as numbers; the rest of the frame is not copied
+    ratings = data['Rating']
+    if not pd.api.types.is_numeric_dtype(ratings):
+        ratings = pd.to_numeric(ratings, errors='coerce')
 
-    negative_reviews = data[data['Sentiment'] == 'Negative']
-    negative_ratings = negative_reviews.groupby('Airline Name')['Rating'].mean().reset_index()
-    negative_ratings['Rating_Type'] = 'Negative Average'
+    # Ratings of non-negative reviews are masked out, so their mean is the negative average
+    ratings_by_type = pd.DataFrame({'Overall Average': ratings,
+                                    'Negative Average': ratings.where(data['Sentiment'] == 'Negative')})
+    averages = ratings_by_type.groupby(data['Airline Name'], sort=False, observed=True).mean()
 
-    all_ratings = pd.concat([overall_ratings, negative_ratings])
-
-    plt.figure(figsize=(12, 6))
-    sns.barplot(x='Airline Name', y='Rating', hue='Rating_Type', data=all_ratings, palette={'Overall Average': 'blue', 'Negative Average': 'slategrey'})  # Specify palette
-    plt.title('Average Rating vs. Negative Average Rating by Airline')
-    plt.xlabel('Airline')
-    plt.ylabel('Average Rating')
-    plt.xticks(rotation=45, ha='right')
-    plt.legend(title='Rating Type')
-    plt.show()
+    show = ax is None
+    if show:
+        ax = _get_fig((12, 6)).add_subplot(111)
+    # The means are already computed, so draw the bars directly (no seaborn re-aggregation or error bars).
+    # Each column of the wide frame is copied into its own C-contiguous float array for matplotlib.
+    positions = np.arange(len(averages))
+    width = 0.25
+    for offset, column, colour in zip((-0.5, 0.5), averages.columns, ['blue', 'slategrey']):
+        heights = np.ascontiguousarray(averages[column].to_numpy(dtype=float, na_value=np.nan))
+        ax.bar(positions + offset * width, heights, width, color=colour, label=column)
+    ax.set_xticks(positions, averages.index.astype(str))
+    ax.set_title('Average Rating vs. Negative Average Rating by Airline')
+    ax.set_xlabel('Airline')
+    ax.set_ylabel('Average Rating')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.legend(title='Rating Type')
+    finish_figure(ax.figure, show, save_path, ax)
 
 
 # Create a bar plot
-def plot_delay_keywords(delay_keywords_df: pd.DataFrame):
+def plot_delay_keywords(delay_keywords_df: pd.DataFrame, ax=None, save_path: str = None):
     """
-    Plots a bar chart showing delay- and cancellation-related keyword counts by airline.
+    Plots a bar chart showing delay- and cancellation-related keyword counts by airline,
+    on 'ax' if given or else in the shared figure. Set 'save_path' (e.g. .svg or .pdf) to save the plot instead of showing it.
     """
-    plt.figure(figsize=(10, 6))
-    sns.barplot(x='Airline Name', y='Delay_Keyword_Count', data=delay_keywords_df, color='blue')
-    plt.title('Frequency of Delay-Related Keywords by Airline')
-    plt.xlabel('Airline')
-    plt.ylabel('Count of Delay Keywords')
-    plt.xticks(rotation=45, ha='right')
-    plt.show()
\ No newline at end of file
+    show = ax is None
+    if show:
+        ax = _get_fig((10, 6)).add_subplot(111)
+    sns.barplot(x='Airline Name', y='Delay_Keyword_Count', data=delay_keywords_df, color='blue', ax=ax)
+    ax.set_title('Frequency of Delay-Related Keywords by Airline')
+    ax.set_xlabel('Airline')
+    ax.set_ylabel('Count of Delay Keywords')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    finish_figure(ax.figure, show, save_path, ax)
+
+# Panel layout of the dashboard: word clouds on top, then the sentiment and airline plots
+DASHBOARD_LAYOUT = [["Positive", "Negative", "Neutral"],
+                    ["polarity", "counts", "by_airline"],
+                    ["ratings", "ratings", "delays"]]
+
+# Columns of the processed reviews drawn by the dashboard panels
+DASHBOARD_COLUMNS = ["Airline Name", "Sentiment", "Polarity", "Subjectivity", "Rating", "Tokens"]
+
+# Draw every plot in a single figure
+def render_dashboard(df: pd.DataFrame, delay_keywords_df: pd.DataFrame, save_path: str = None) -> None:
+    """
+    Draws all the sentiment visualisations as panels of one figure and shows it once.
+
+    Steps
+    -----
+    - Keep only the columns the panels draw ('DASHBOARD_COLUMNS', or 'Clean_Review' in place of missing 'Tokens'),
+      so the review texts are not copied.
+    - Cast the grouping columns to categorical and stably sort the reviews by airline once, so every plot
+      groups an already sorted key (with sort=False); the delay counts are put in the same airline order.
+    - Create one figure with a panel for each plot (see 'DASHBOARD_LAYOUT').
+    - Draw the word clouds and each plot on its own panel.
+    - Show the figure, or save it to 'save_path' if given.
+
+    Parameters
+    ----------
+    df : The processed DataFrame with the cleaned reviews, sentiment, polarity, subjectivity and rating.
+    delay_keywords_df : The delay keyword counts by airline from 'analyse_delays'.
+    save_path : Optional file to save the dashboard to (e.g. 'dashboard.pdf') instead of showing it.
+
+    Returns
+    -------
+    None
+
+    Example Usage
+    -------------
+    render_dashboard(df_processed, delay_keywords_df)
+    """
+    columns = DASHBOARD_COLUMNS if 'Tokens' in df.columns else DASHBOARD_COLUMNS[:-1] + ['Clean_Review']
+    df = to_categorical(df[columns]).sort_values('Airline Name', kind='stable').reset_index(drop=True)
+    delay_keywords_df = delay_keywords_df.sort_values('Airline Name', kind='stable')
+
+    fig, axes = plt.subplot_mosaic(DASHBOARD_LAYOUT, figsize=(24, 20), layout='constrained')
+
+    generate_word_clouds(df, axes=[axes[sentiment] for sentiment in WORDCLOUD_SENTIMENTS])
+    plot_polarity_subjectivity(df, ax=axes["polarity"])
+    plot_sentiment_counts(df, ax=axes["counts"])
+    plot_sentiment_by_airline(df, ax=axes["by_airline"])
+    plot_average_rating_by_airline(df, ax=axes["ratings"])
+    plot_delay_keywords(delay_keywords_df, ax=axes["delays"])
+    finish_figure(fig, True, save_path)